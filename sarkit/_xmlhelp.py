@@ -3,7 +3,9 @@ Common XML Helper functionality
 """
 
 import abc
+import binascii
 import datetime
+import functools
 import inspect
 import re
 from collections.abc import Sequence
@@ -23,6 +25,23 @@ def inheritdocstring(cls):
     return cls
 
 
+@functools.lru_cache(maxsize=1024)
+def _tag_namespace(tag):
+    """Returns the namespace URI of a Clark-notation ``tag``"""
+    return lxml.etree.QName(tag).namespace
+
+
+def _as_python_scalars(arr):
+    """Returns the elements of ``arr`` as Python scalars when doing so does not change their ``str``
+
+    A single ``tolist`` call is much cheaper than ``str`` on each numpy scalar, but only float64,
+    integer, and boolean elements have the same text as their Python counterparts.
+    """
+    if arr.dtype == np.float64 or arr.dtype.kind in "biu":
+        return arr.tolist()
+    return arr
+
+
 class Type:
     """Base class for transcoders which provide methods for parsing, setting, and making XML elements."""
 
@@ -113,7 +132,8 @@ class HexType(Type):
 
     def parse_elem(self, elem: lxml.etree.Element) -> bytes:
         """Returns a byte string constructed from the string ``elem.text``."""
-        return bytes.fromhex(elem.text)
+        # xs:hexBinary collapses whitespace, so only the ends need stripping
+        return binascii.unhexlify(elem.text.strip())
 
     def set_elem(self, elem: lxml.etree.Element, val: bytes) -> None:
         """Set ``elem.text`` to a hex string representation of the byte string ``val``."""
@@ -136,9 +156,9 @@ class XdtType(Type):
         If ``val`` is naive, the timezone is assumed to be UTC.
 
         """
-        is_aware = val.tzinfo is not None and val.tzinfo.utcoffset(None) is not None
-        dt = val.astimezone(datetime.timezone.utc) if is_aware else val
-        elem.text = dt.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+        if val.utcoffset() is not None:
+            val = val.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+        elem.text = val.isoformat(timespec="microseconds") + "Z"
 
 
 class PolyNdType(Type):
@@ -173,15 +193,14 @@ class PolyNdType(Type):
             the term of multi-exponent n_1, n_2, ..., n_nvar is contained in ``val[n_1, n_2, ..., n_nvar]``.
 
         """
-        coef_by_exponents = {
-            tuple(
-                int(coef.get(f"exponent{x}")) for x in range(1, self.nvar + 1)
-            ): float(coef.text)
-            for coef in elem
-        }
-        coefs = np.zeros(np.max(list(coef_by_exponents), axis=0) + 1, np.float64)
-        for exponents, coef in coef_by_exponents.items():
-            coefs[*exponents] = coef
+        exponent_names = [f"exponent{x}" for x in range(1, self.nvar + 1)]
+        exponents = np.array(
+            [[int(coef.get(name)) for name in exponent_names] for coef in elem],
+            dtype=np.intp,
+        ).reshape(-1, self.nvar)
+        values = np.array([float(coef.text) for coef in elem], np.float64)
+        coefs = np.zeros(exponents.max(axis=0) + 1, np.float64)
+        coefs[tuple(exponents.T)] = values
         return coefs
 
     def set_elem(self, elem: lxml.etree.Element, val: npt.ArrayLike) -> None:
@@ -200,13 +219,17 @@ class PolyNdType(Type):
         if coefs.ndim != self.nvar:
             raise ValueError(f"Coefficient array must have ndim={self.nvar}")
         elem[:] = []
-        elem_ns = self.child_ns if self.child_ns else lxml.etree.QName(elem).namespace
+        elem_ns = self.child_ns if self.child_ns else _tag_namespace(elem.tag)
         ns = f"{{{elem_ns}}}" if elem_ns else ""
         for dim, ncoef in enumerate(coefs.shape):
             elem.set(f"order{dim + 1}", str(ncoef - 1))
-        for coord, coef in np.ndenumerate(coefs):
-            attribs = {f"exponent{d + 1}": str(c) for d, c in enumerate(coord)}
-            lxml.etree.SubElement(elem, ns + "Coef", attrib=attribs).text = str(coef)
+        coef_tag = ns + "Coef"
+        exponent_names = [f"exponent{d + 1}" for d in range(self.nvar)]
+        for coord, coef in zip(
+            np.ndindex(coefs.shape), _as_python_scalars(coefs.ravel())
+        ):
+            attribs = dict(zip(exponent_names, map(str, coord)))
+            lxml.etree.SubElement(elem, coef_tag, attrib=attribs).text = str(coef)
 
 
 class PolyType(PolyNdType):
@@ -253,7 +276,8 @@ class XyzPolyType(Type):
             polynomials.
 
         """
-        xyz = [PolyType().parse_elem(elem.find(f"{{*}}{d}")) for d in "XYZ"]
+        poly_type = PolyType()
+        xyz = [poly_type.parse_elem(elem.find(f"{{*}}{d}")) for d in "XYZ"]
         xyz_coefs = np.zeros_like(xyz[0], shape=(max(len(d) for d in xyz), len(xyz)))
         for dim, coefs in enumerate(xyz):
             xyz_coefs[: len(coefs), dim] = coefs
@@ -276,11 +300,12 @@ class XyzPolyType(Type):
         if coefs.shape[1] != 3:
             raise ValueError(f"{coefs.shape[1]=} must be 3")
         elem[:] = []
-        elem_ns = self.child_ns if self.child_ns else lxml.etree.QName(elem).namespace
+        elem_ns = self.child_ns if self.child_ns else _tag_namespace(elem.tag)
         ns = f"{{{elem_ns}}}" if elem_ns else ""
-        for index, tag in enumerate("XYZ"):
+        poly_type = PolyType()
+        for tag, dim_coefs in zip("XYZ", coefs.T):
             subelem = lxml.etree.SubElement(elem, ns + tag)
-            PolyType().set_elem(subelem, coefs[:, index])
+            poly_type.set_elem(subelem, dim_coefs)
 
 
 class SequenceType(abc.ABC, Type):
@@ -329,7 +354,7 @@ class SequenceType(abc.ABC, Type):
         if self.subelements.keys() != val.keys():
             raise ValueError(f"{(val.keys())=} must match {self.subelements.keys()=}")
         elem[:] = []
-        elem_ns = self.child_ns if self.child_ns else lxml.etree.QName(elem).namespace
+        elem_ns = self.child_ns if self.child_ns else _tag_namespace(elem.tag)
         ns = f"{{{elem_ns}}}" if elem_ns else ""
         for e_name, e_type in self.subelements.items():
             subelem = lxml.etree.SubElement(elem, ns + e_name)
@@ -357,13 +382,13 @@ class ArrayType(SequenceType):
             Sequence of element values in ``subelements`` order
 
         """
+        if isinstance(val, np.ndarray):
+            val = _as_python_scalars(val)
         if len(self.subelements) != len(val):
             raise ValueError(
                 f"{len(self.subelements)=} does not match expected {len(val)=}"
             )
-        super().set_subelements(
-            elem, dict((k, v) for k, v in zip(self.subelements, val, strict=True))
-        )
+        super().set_subelements(elem, dict(zip(self.subelements, val, strict=True)))
 
 
 class XyType(ArrayType):
@@ -486,7 +511,7 @@ class CmplxType(SequenceType):
 
     def parse_elem(self, elem: lxml.etree.Element) -> complex:
         """Returns the complex number encoded in ``elem``."""
-        return complex(*super().parse_subelements(elem).values())
+        return complex(float(elem.findtext("{*}Real")), float(elem.findtext("{*}Imag")))
 
     def set_elem(self, elem: lxml.etree.Element, val: complex) -> None:
         """Set ``elem`` node to the complex number ``val``."""
@@ -550,7 +575,7 @@ class ListType(Type):
 
         """
         elem[:] = []
-        elem_ns = self.child_ns if self.child_ns else lxml.etree.QName(elem).namespace
+        elem_ns = self.child_ns if self.child_ns else _tag_namespace(elem.tag)
         ns = f"{{{elem_ns}}}" if elem_ns else ""
         if self.include_size_attr:
             elem.set("size", str(len(val)))
@@ -617,7 +642,7 @@ class MtxType(Type):
         if self.shape != mtx.shape:
             raise ValueError(f"{mtx.shape=} does not match expected {self.shape}")
         elem[:] = []
-        elem_ns = lxml.etree.QName(elem).namespace
+        elem_ns = _tag_namespace(elem.tag)
         ns = f"{{{elem_ns}}}" if elem_ns else ""
         for d, nd in zip((1, 2), mtx.shape, strict=True):
             elem.set(f"size{d}", str(nd))
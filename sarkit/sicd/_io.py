@@ -335,19 +335,20 @@ class NitfMetadata:
 
     def __eq__(self, other):
         if isinstance(other, NitfMetadata):
+            # Compare the NITF parts first so the XML is only canonicalized when needed
             self_parts = (
-                lxml.etree.tostring(self.xmltree, method="c14n"),
                 self.file_header_part,
                 self.im_subheader_part,
                 self.de_subheader_part,
             )
             other_parts = (
-                lxml.etree.tostring(other.xmltree, method="c14n"),
                 other.file_header_part,
                 other.im_subheader_part,
                 other.de_subheader_part,
             )
-            return self_parts == other_parts
+            return self_parts == other_parts and lxml.etree.tostring(
+                self.xmltree, method="c14n"
+            ) == lxml.etree.tostring(other.xmltree, method="c14n")
         return False
 
 
@@ -17,7 +17,15 @@ def _xyzpolyval(x, c):
     """Similar to polyval but moves xyz to last dim."""
     assert c.ndim == 2
     assert c.shape[1] == 3
-    return np.moveaxis(npp.polyval(x, c), 0, -1)
+    x = np.asarray(x)
+    # Horner's method accumulated in place to avoid a temporary per coefficient
+    c = c.reshape(c.shape + (1,) * x.ndim)
+    out = np.empty((3,) + x.shape, dtype=np.result_type(x, c, 1.0))
+    out[...] = c[-1]
+    for coefs in c[-2::-1]:
+        out *= x
+        out += coefs
+    return np.moveaxis(out, 0, -1)
 
 
 def image_grid_to_image_plane_point(
@@ -1237,74 +1245,96 @@ def r_rdot_to_constant_hae_surface(
         )
 
     hae0 = np.broadcast_to(hae0, gref.shape[:-1])
-    gref = np.array(gref)  # make writable
-    u_gpn = np.array(u_gpn)  # make writable
+    gref = np.array(gref, order="C")  # make writable
+    u_gpn = np.array(u_gpn, order="C")  # make writable
     u_up = np.full(gref.shape, np.nan)
     gpp = np.full(gref.shape, np.nan)
     delta_hae = np.full(gref.shape[:-1], np.nan)
-    success = False
     above_threshold = np.full(gref.shape[:-1], True)
     r_rdot_to_plane_success = np.full(gref.shape[:-1], False)
+
+    # Flattened views so that each iteration gathers the points still above threshold
+    # with one integer index rather than repeated boolean masks over the full shape
+    def _flat(arr):
+        arr = np.asarray(arr)
+        return arr.reshape((-1,) + arr.shape[hae0.ndim :])
+
+    def _flat_out(arr):
+        # results are written through the flattened array, so it must be a view; reshape
+        # only guarantees that for the C-contiguous arrays allocated above
+        assert arr.flags.c_contiguous
+        return _flat(arr)
+
+    gref_f, u_gpn_f, u_up_f, gpp_f = map(_flat_out, (gref, u_gpn, u_up, gpp))
+    delta_hae_f, hae0_f = _flat_out(delta_hae), _flat(hae0)
+    r_rdot_to_plane_success_f = _flat_out(r_rdot_to_plane_success)
+    t_coa_f = _flat(projection_sets.t_COA)
+    if isinstance(projection_sets, params.ProjectionSetsMono):
+        arp_f, varp_f = _flat(arp), _flat(varp)
+        r_f, rdot_f = _flat(projection_sets.R_COA), _flat(projection_sets.Rdot_COA)
+    else:
+        xmt_f, vxmt_f, rcv_f, vrcv_f = map(_flat, (xmt, vxmt, rcv, vrcv))
+        r_f = _flat(projection_sets.R_Avg_COA)
+        rdot_f = _flat(projection_sets.Rdot_Avg_COA)
+    active = np.flatnonzero(above_threshold)
     for _ in range(nlim):
         # Compute precise projection to ground plane.
         if isinstance(projection_sets, params.ProjectionSetsMono):
-            gpp[above_threshold, :] = r_rdot_to_ground_plane_mono(
+            gpp_f[active] = r_rdot_to_ground_plane_mono(
                 look,
                 params.ProjectionSetsMono(
-                    t_COA=projection_sets.t_COA[above_threshold],
-                    ARP_COA=arp[above_threshold, :],
-                    VARP_COA=varp[above_threshold, :],
-                    R_COA=projection_sets.R_COA[above_threshold],
-                    Rdot_COA=projection_sets.Rdot_COA[above_threshold],
+                    t_COA=t_coa_f[active],
+                    ARP_COA=arp_f[active],
+                    VARP_COA=varp_f[active],
+                    R_COA=r_f[active],
+                    Rdot_COA=rdot_f[active],
                 ),
-                gref[above_threshold, :],
-                u_gpn[above_threshold, :],
+                gref_f[active],
+                u_gpn_f[active],
             )
-            r_rdot_to_plane_success[above_threshold] = np.isfinite(
-                gpp[above_threshold, :]
-            ).all(axis=-1)
+            r_rdot_to_plane_success_f[active] = np.isfinite(gpp_f[active]).all(axis=-1)
         else:
-            gpp[above_threshold, :], _, r_rdot_to_plane_success[above_threshold] = (
+            gpp_f[active], _, r_rdot_to_plane_success_f[active] = (
                 r_rdot_to_ground_plane_bi(
                     look,
                     scp,
                     params.ProjectionSetsBi(
-                        t_COA=projection_sets.t_COA[above_threshold],
-                        tx_COA=projection_sets.t_COA[above_threshold],  # unused
-                        tr_COA=projection_sets.t_COA[above_threshold],  # unused
-                        Xmt_COA=xmt[above_threshold, :],
-                        VXmt_COA=vxmt[above_threshold, :],
-                        Rcv_COA=rcv[above_threshold, :],
-                        VRcv_COA=vrcv[above_threshold, :],
-                        R_Avg_COA=projection_sets.R_Avg_COA[above_threshold],
-                        Rdot_Avg_COA=projection_sets.Rdot_Avg_COA[above_threshold],
+                        t_COA=t_coa_f[active],
+                        tx_COA=t_coa_f[active],  # unused
+                        tr_COA=t_coa_f[active],  # unused
+                        Xmt_COA=xmt_f[active],
+                        VXmt_COA=vxmt_f[active],
+                        Rcv_COA=rcv_f[active],
+                        VRcv_COA=vrcv_f[active],
+                        R_Avg_COA=r_f[active],
+                        Rdot_Avg_COA=rdot_f[active],
                     ),
-                    gref[above_threshold, :],
-                    u_gpn[above_threshold, :],
+                    gref_f[active],
+                    u_gpn_f[active],
                     delta_gp_gpp=bistat_delta_gp_gpp,
                     maxiter=bistat_maxiter,
                 )
             )
 
         # Convert from ECEF to WGS 84 geodetic
-        gpp_llh = sarkit.wgs84.cartesian_to_geodetic(gpp[above_threshold, :])
+        gpp_llh = sarkit.wgs84.cartesian_to_geodetic(gpp_f[active])
 
         # Compute unit vector in increasing height direction and height difference at GPP.
-        u_up[above_threshold, :] = _calc_up(gpp_llh[..., 0], gpp_llh[..., 1])
-        delta_hae[above_threshold] = gpp_llh[..., 2] - hae0[above_threshold]
+        u_up_f[active] = _calc_up(gpp_llh[..., 0], gpp_llh[..., 1])
+        delta_hae_f[active] = gpp_llh[..., 2] - hae0_f[active]
 
         # Check if GPP is sufficiently close to HAE0 surface.
         above_threshold = delta_hae > delta_hae_max
-        success = bool(
-            (delta_hae <= delta_hae_max).all() and r_rdot_to_plane_success.all()
-        )
-        if success:
+        active = np.flatnonzero(above_threshold)
+        if active.size == 0:
+            # converged, and further iterations can't change points that failed to project
             break
-        gref[above_threshold, :] = (
-            gpp[above_threshold, :]
-            - delta_hae[above_threshold][..., np.newaxis] * u_up[above_threshold, :]
+        gref_f[active] = (
+            gpp_f[active] - delta_hae_f[active][..., np.newaxis] * u_up_f[active]
         )
-        u_gpn[above_threshold, :] = u_up[above_threshold, :]
+        u_gpn_f[active] = u_up_f[active]
+
+    success = bool((delta_hae <= delta_hae_max).all() and r_rdot_to_plane_success.all())
 
     # Compute slant plane normal tangent to R/Rdot contour at GPP.
     if isinstance(projection_sets, params.ProjectionSetsMono):
@@ -304,6 +304,26 @@ class NitfMetadata:
             self.file_header_part = NitfFileHeaderPart(**self.file_header_part)
 
 
+def _readinto_exactly(file_object, array):
+    """Fill contiguous ``array`` from ``file_object``, looping over short reads"""
+    view = memoryview(array.reshape(-1).view(np.uint8))
+    while view:
+        nread = file_object.readinto(view)
+        if not nread:
+            raise EOFError(f"Unable to read {view.nbytes} remaining bytes")
+        view = view[nread:]
+
+
+def _write_all(file_object, array):
+    """Write all of ``array`` to ``file_object``, looping over partial writes"""
+    view = memoryview(np.ascontiguousarray(array).reshape(-1).view(np.uint8))
+    while view:
+        nwritten = file_object.write(view)
+        if not nwritten:
+            raise OSError(f"Unable to write {view.nbytes} remaining bytes")
+        view = view[nwritten:]
+
+
 class NitfReader:
     """Read a SIDD NITF
 
@@ -517,13 +537,12 @@ class NitfReader:
         imseg_sizes = np.asarray([imseg["Data"].size for imseg in imsegs])
         imseg_offsets = np.asarray([imseg["Data"].get_offset() for imseg in imsegs])
         splits = np.cumsum(imseg_sizes // (shape[-1] * dtype.itemsize))[:-1]
-        for split, sz, offset in zip(
-            np.array_split(image_pixels, splits, axis=0), imseg_sizes, imseg_offsets
+        for split, offset in zip(
+            np.array_split(image_pixels, splits, axis=0), imseg_offsets
         ):
-            this_os = offset - self._file_object.tell()
-            split[...] = np.fromfile(
-                self._file_object, dtype, count=sz // dtype.itemsize, offset=this_os
-            ).reshape(split.shape)
+            # readinto rather than np.fromfile so that in-memory file objects also work
+            self._file_object.seek(offset, os.SEEK_SET)
+            _readinto_exactly(self._file_object, split)
 
         return image_pixels
 
@@ -895,7 +914,7 @@ class NitfWriter:
                 first_row : first_row + imseg["SubHeader"]["NROWS"].value
             ]
             raw_array = raw_array.astype(raw_dtype.newbyteorder(">"), copy=False)
-            raw_array.tofile(self._file)
+            _write_all(self._file, raw_array)
 
         self._images_written.add(image_number)
 
@@ -126,21 +126,20 @@ class ConsistencyChecker(object):
             if isinstance(func_name, str):
                 func_name = [func_name]
 
-            def matches_prefix(requested, actual):
-                return actual.startswith(requested)
-
-            def matches_exact(requested, actual):
-                return requested == actual
-
-            qualifier = matches_prefix if allow_prefix else matches_exact
+            funcs_by_name = {func.__name__: func for func in self.funcs}
             funcs = []
             not_found = []
             for requested_func in set(func_name):
-                matches = [
-                    func
-                    for func in self.funcs
-                    if qualifier(requested_func, func.__name__)
-                ]
+                if allow_prefix:
+                    matches = [
+                        func
+                        for name, func in funcs_by_name.items()
+                        if name.startswith(requested_func)
+                    ]
+                elif requested_func in funcs_by_name:
+                    matches = [funcs_by_name[requested_func]]
+                else:
+                    matches = []
                 funcs.extend(matches)
                 if not matches:
                     not_found.append(requested_func)
@@ -148,8 +147,13 @@ class ConsistencyChecker(object):
             if not_found:
                 raise ValueError(f"Functions not found: {not_found}")
 
-        for pattern in ignore_patterns or []:
-            funcs = [func for func in funcs if not re.match(pattern, func.__name__)]
+        if ignore_patterns:
+            ignore_res = [re.compile(p) for p in ignore_patterns]
+            funcs = [
+                func
+                for func in funcs
+                if not any(r.match(func.__name__) for r in ignore_res)
+            ]
 
         for func in funcs:
             self._run_check(func)
@@ -236,7 +240,6 @@ class ConsistencyChecker(object):
             + "\n".join(str(x) for x in e.args)
         )
 
-    @contextlib.contextmanager
     def need(self, details=None):
         """Context manager for scoping 'Error' level checks
 
@@ -246,10 +249,8 @@ class ConsistencyChecker(object):
             Text describing the scope of checks
         """
 
-        with self._crave("Error", details=details):
-            yield
+        return self._crave("Error", details=details)
 
-    @contextlib.contextmanager
     def want(self, details=None):
         """Context manager for scoping 'Warning' level checks
 
@@ -259,11 +260,10 @@ class ConsistencyChecker(object):
             Text describing the scope of checks
         """
 
-        with self._crave("Warning", details=details):
-            yield
+        return self._crave("Warning", details=details)
 
     @contextlib.contextmanager
-    def _crave(self, level, details=None, depth=2):
+    def _crave(self, level, details=None, depth=1):
         """Context manager for scoping checks
 
         Parameters
@@ -337,13 +337,13 @@ class ConsistencyChecker(object):
             Dictionary containing only results of failed checks
         """
 
-        retval = {}
-        for k, v in self._all_check_results.items():
-            if not v["passed"]:
-                retval[k] = dict(v)
-                if omit_passed_sub:
-                    retval[k]["details"] = [d for d in v["details"] if not d["passed"]]
-        return retval
+        failed = {k: v for k, v in self._all_check_results.items() if not v["passed"]}
+        if not omit_passed_sub:
+            return {k: dict(v) for k, v in failed.items()}
+        return {
+            k: v | {"details": [d for d in v["details"] if not d["passed"]]}
+            for k, v in failed.items()
+        }
 
     def passes(self):
         """Returns passed checks that are not wholly No-Op.
@@ -415,13 +415,14 @@ class ConsistencyChecker(object):
             color = (
                 sys.stdout.isatty() and "NO_COLOR" not in os.environ
             )  # https://no-color.org
-        to_print = {}
-        for k, v in self._all_check_results.items():
-            if include_passed_checks or not v["passed"]:
-                to_print[k] = dict(v)
-                to_print[k]["details"] = [
-                    d for d in v["details"] if include_passed_asserts or not d["passed"]
-                ]
+        to_print = {
+            k: (
+                v["doc"],
+                [d for d in v["details"] if include_passed_asserts or not d["passed"]],
+            )
+            for k, v in self._all_check_results.items()
+            if include_passed_checks or not v["passed"]
+        }
 
         if color:
             coloration = {
@@ -439,21 +440,21 @@ class ConsistencyChecker(object):
                 ("Warning", False): ["[Warning]"],
                 ("No-Op", True): ["[Skip]"],
             }
+        leads = {key: in_color(*value) for key, value in coloration.items()}
+        need_want = {"Error": "Need", "Warning": "Want", "No-Op": "Unless"}
 
+        # collect the report and write it at once rather than print line by line
         indent = 4
-        for case, details in to_print.items():
-            print(f"{case}: {str(details['doc']).strip()}")
-            if details["details"]:
-                for sub in details["details"]:
-                    lead = in_color(*coloration[sub["severity"], sub["passed"]])
-                    need_want = {"Error": "Need", "Warning": "Want", "No-Op": "Unless"}[
-                        sub["severity"]
-                    ]
-                    print(
+        lines = []
+        for case, (doc, details) in to_print.items():
+            lines.append(f"{case}: {str(doc).strip()}")
+            if details:
+                for sub in details:
+                    lines.append(
                         "{indent}{lead} {need_want}: {details}".format(
                             indent=" " * indent,
-                            lead=lead,
-                            need_want=need_want,
+                            lead=leads[sub["severity"], sub["passed"]],
+                            need_want=need_want[sub["severity"]],
                             details=sub["details"],
                         )
                     )
@@ -464,17 +465,20 @@ class ConsistencyChecker(object):
                         or (pass_detail and sub["passed"])
                     ):
                         for line in sub["message"].splitlines():
-                            message = "\n".join(
-                                textwrap.wrap(
-                                    line,
-                                    width=width,
-                                    subsequent_indent=" " * (indent + 8),
-                                    initial_indent=" " * (indent + 4),
+                            lines.append(
+                                "\n".join(
+                                    textwrap.wrap(
+                                        line,
+                                        width=width,
+                                        subsequent_indent=" " * (indent + 8),
+                                        initial_indent=" " * (indent + 4),
+                                    )
                                 )
                             )
-                            print(message)
             else:
-                print("{}---: No test performed".format(" " * indent))
+                lines.append("{}---: No test performed".format(" " * indent))
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
 
     @staticmethod
     def add_cli_args(parser):
@@ -519,7 +523,7 @@ class ConsistencyChecker(object):
                 skip_detail=config.verbose >= 4,
                 color=config.color,
             )
-            return bool(self.failures())
+            return any(not v["passed"] for v in self._all_check_results.values())
 
 
 class Approx:
@@ -544,9 +548,33 @@ class Approx:
     __array_priority__ = 100
 
     def __init__(self, value, atol=1e-10, rtol=1e-6):
-        self.value = value
-        self.atol = atol
-        self.rtol = rtol
+        self._value = value
+        self._atol = atol
+        self._rtol = rtol
+        # value and the tolerances are read-only, so the np.isclose tolerance is computed once.
+        # Like np.isclose, integers are compared as floats and non-finite values are only
+        # close to themselves
+        value = _as_inexact(value)
+        self._inexact_value = value
+        with np.errstate(invalid="ignore"):
+            self._tol = np.where(
+                np.isfinite(value), atol + np.abs(value) * rtol, np.nan
+            )
+
+    @property
+    def value(self):
+        """The value to be compared"""
+        return self._value
+
+    @property
+    def atol(self):
+        """Absolute tolerance"""
+        return self._atol
+
+    @property
+    def rtol(self):
+        """Relative tolerance"""
+        return self._rtol
 
     def __lt__(self, rhs):
         return self.__le__(rhs)
@@ -571,7 +599,19 @@ class Approx:
         return f"{self.value} ± {tol}"
 
     def _isclose(self, rhs):
-        return np.isclose(rhs, self.value, rtol=self.rtol, atol=self.atol)
+        # same test as np.isclose; equality catches matching infinities
+        rhs = _as_inexact(rhs)
+        with np.errstate(invalid="ignore"):
+            return np.logical_or(
+                np.equal(rhs, self._inexact_value),
+                np.less_equal(np.abs(np.subtract(rhs, self._inexact_value)), self._tol),
+            )
+
+
+def _as_inexact(x):
+    """Returns ``x`` as an array of at least float type so that differences cannot wrap around"""
+    x = np.asarray(x)
+    return x.astype(np.result_type(x, 1.0), copy=False)
 
 
 def in_color(string: str, *color: str) -> str:
@@ -0,0 +1,10 @@
+import functools
+
+import lxml.etree
+import pytest
+
+
+@pytest.fixture(scope="session")
+def xml_schema():
+    """Returns a function that compiles an XML schema file once per test session"""
+    return functools.cache(lambda schema_file: lxml.etree.XMLSchema(file=schema_file))
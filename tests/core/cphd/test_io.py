@@ -82,10 +82,10 @@ def _random_support_array(cphd_xmltree, sa_id):
     )
 
 
-def test_roundtrip(tmp_path):
+def test_roundtrip(tmp_path, xml_schema):
     basis_etree = lxml.etree.parse(DATAPATH / "example-cphd-1.0.1.xml")
     basis_version = lxml.etree.QName(basis_etree.getroot()).namespace
-    schema = lxml.etree.XMLSchema(file=skcphd.VERSION_INFO[basis_version]["schema"])
+    schema = xml_schema(skcphd.VERSION_INFO[basis_version]["schema"])
     schema.assertValid(basis_etree)
     xmlhelp = skcphd.XmlHelper(basis_etree)
     channel_ids = [
@@ -144,7 +144,7 @@ def test_roundtrip(tmp_path):
     ) == lxml.etree.tostring(basis_etree, method="c14n")
 
 
-def test_roundtrip_compressed(tmp_path):
+def test_roundtrip_compressed(tmp_path, xml_schema):
     basis_etree = lxml.etree.parse(DATAPATH / "example-cphd-1.0.1.xml")
     basis_version = lxml.etree.QName(basis_etree.getroot()).namespace
     assert basis_etree.find("{*}Data/{*}SignalCompressionID") is None
@@ -161,7 +161,7 @@ def test_roundtrip_compressed(tmp_path):
     )
     data_chan_elem.append(em.CompressedSignalSize(str(len(ch_id.encode()))))
 
-    schema = lxml.etree.XMLSchema(file=skcphd.VERSION_INFO[basis_version]["schema"])
+    schema = xml_schema(skcphd.VERSION_INFO[basis_version]["schema"])
     schema.assertValid(basis_etree)
     xmlhelp = skcphd.XmlHelper(basis_etree)
     num_vectors = xmlhelp.load("./{*}Data/{*}Channel/{*}NumVectors")
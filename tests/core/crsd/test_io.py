@@ -8,10 +8,10 @@ import sarkit.crsd as skcrsd
 DATAPATH = pathlib.Path(__file__).parents[3] / "data"
 
 
-def test_roundtrip(tmp_path, caplog):
+def test_roundtrip(tmp_path, caplog, xml_schema):
     basis_etree = lxml.etree.parse(DATAPATH / "example-crsd-1.0-draft.2025-02-25.xml")
     basis_version = lxml.etree.QName(basis_etree.getroot()).namespace
-    schema = lxml.etree.XMLSchema(file=skcrsd.VERSION_INFO[basis_version]["schema"])
+    schema = xml_schema(skcrsd.VERSION_INFO[basis_version]["schema"])
     schema.assertValid(basis_etree)
     xmlhelp = skcrsd.XmlHelper(basis_etree)
     channel_ids = [
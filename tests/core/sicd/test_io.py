@@ -1,3 +1,5 @@
+import copy
+import functools
 import pathlib
 
 import lxml.etree
@@ -9,6 +11,106 @@ import sarkit.sicd as sksicd
 
 DATAPATH = pathlib.Path(__file__).parents[3] / "data"
 
+_RNG = np.random.default_rng(12345)
+
+# Data is unclassified.  These fields are filled for testing purposes only.
+_FILE_HEADER_PART = {
+    "ostaid": "ostaid",
+    "ftitle": "ftitle",
+    "security": {
+        "clas": "T",
+        "clsy": "US",
+        "code": "code_h",
+        "ctlh": "hh",
+        "rel": "rel_h",
+        "dctp": "DD",
+        "dcdt": "20000101",
+        "dcxm": "25X1",
+        "dg": "C",
+        "dgdt": "20000102",
+        "cltx": "CW_h",
+        "catp": "O",
+        "caut": "caut_h",
+        "crsn": "A",
+        "srdt": "",
+        "ctln": "ctln_h",
+    },
+    "oname": "oname",
+    "ophone": "ophone",
+}
+
+_IM_SUBHEADER_PART = {
+    "tgtid": "tgtid",
+    "iid2": "iid2",
+    "security": {
+        "clas": "S",
+        "clsy": "II",
+        "code": "code_i",
+        "ctlh": "ii",
+        "rel": "rel_i",
+        "dctp": "",
+        "dcdt": "",
+        "dcxm": "X2",
+        "dg": "R",
+        "dgdt": "20000202",
+        "cltx": "RL_i",
+        "catp": "D",
+        "caut": "caut_i",
+        "crsn": "B",
+        "srdt": "20000203",
+        "ctln": "ctln_i",
+    },
+    "isorce": "isorce",
+    "icom": ["first comment", "second comment"],
+}
+
+_DE_SUBHEADER_PART = {
+    "security": {
+        "clas": "U",
+        "clsy": "DD",
+        "code": "code_d",
+        "ctlh": "dd",
+        "rel": "rel_d",
+        "dctp": "X",
+        "dcdt": "",
+        "dcxm": "X3",
+        "dg": "",
+        "dgdt": "20000302",
+        "cltx": "CH_d",
+        "catp": "M",
+        "caut": "caut_d",
+        "crsn": "C",
+        "srdt": "20000303",
+        "ctln": "ctln_d",
+    },
+    "desshrp": "desshrp",
+    "desshli": "desshli",
+    "desshlin": "desshlin",
+    "desshabs": "desshabs",
+}
+
+
+def _make_metadata(xmltree, **file_header_part):
+    return sksicd.NitfMetadata(
+        xmltree=xmltree,
+        file_header_part=_FILE_HEADER_PART | file_header_part,
+        im_subheader_part=_IM_SUBHEADER_PART,
+        de_subheader_part=_DE_SUBHEADER_PART,
+    )
+
+
+@functools.cache
+def _validated_xmltree(xml_file, xml_schema):
+    etree = lxml.etree.parse(xml_file)
+    basis_version = lxml.etree.QName(etree.getroot()).namespace
+    xml_schema(sksicd.VERSION_INFO[basis_version]["schema"]).assertValid(etree)
+    return etree
+
+
+def _parse_validated(xml_file, xml_schema):
+    """Returns a fresh copy of ``xml_file``, which is parsed and validated only once"""
+    return copy.deepcopy(_validated_xmltree(xml_file, xml_schema))
+
 
 def _random_image(sicd_xmltree):
     xml_helper = sksicd.XmlHelper(sicd_xmltree)
@@ -18,9 +120,7 @@ def _random_image(sicd_xmltree):
 
     assert sicd_xmltree.findtext("./{*}ImageData/{*}PixelType") == "RE32F_IM32F"
 
-    components = (
-        2 * np.random.default_rng().random(shape + (2,), dtype=np.float32)
-    ) - 1
+    components = (2 * _RNG.random(shape + (2,), dtype=np.float32)) - 1
     return components.astype(">f4").view(">c8").squeeze()
 
 
@@ -33,9 +133,9 @@ def _random_image(sicd_xmltree):
         (DATAPATH / "example-sicd-1.4.0.xml", "RE32F_IM32F"),
     ],
 )
-def test_roundtrip(tmp_path, sicd_xml, pixel_type):
+def test_roundtrip(tmp_path, sicd_xml, pixel_type, xml_schema):
     out_sicd = tmp_path / "out.sicd"
-    basis_etree = lxml.etree.parse(sicd_xml)
+    basis_etree = _parse_validated(sicd_xml, xml_schema)
     basis_array = _random_image(basis_etree)
 
     dtype = sksicd.PIXEL_TYPES[pixel_type]["dtype"]
@@ -56,87 +156,9 @@ def test_roundtrip(tmp_path, sicd_xml, pixel_type):
         )
     basis_etree.find("{*}ImageData/{*}PixelType").text = pixel_type
     basis_version = lxml.etree.QName(basis_etree.getroot()).namespace
-    schema = lxml.etree.XMLSchema(file=sksicd.VERSION_INFO[basis_version]["schema"])
-    schema.assertValid(basis_etree)
-
-    metadata = sksicd.NitfMetadata(
-        xmltree=basis_etree,
-        file_header_part={
-            "ostaid": "ostaid",
-            "ftitle": "ftitle",
-            # Data is unclassified.  These fields are filled for testing purposes only.
-            "security": {
-                "clas": "T",
-                "clsy": "US",
-                "code": "code_h",
-                "ctlh": "hh",
-                "rel": "rel_h",
-                "dctp": "DD",
-                "dcdt": "20000101",
-                "dcxm": "25X1",
-                "dg": "C",
-                "dgdt": "20000102",
-                "cltx": "CW_h",
-                "catp": "O",
-                "caut": "caut_h",
-                "crsn": "A",
-                "srdt": "",
-                "ctln": "ctln_h",
-            },
-            "oname": "oname",
-            "ophone": "ophone",
-        },
-        im_subheader_part={
-            "tgtid": "tgtid",
-            "iid2": "iid2",
-            # Data is unclassified.  These fields are filled for testing purposes only.
-            "security": {
-                "clas": "S",
-                "clsy": "II",
-                "code": "code_i",
-                "ctlh": "ii",
-                "rel": "rel_i",
-                "dctp": "",
-                "dcdt": "",
-                "dcxm": "X2",
-                "dg": "R",
-                "dgdt": "20000202",
-                "cltx": "RL_i",
-                "catp": "D",
-                "caut": "caut_i",
-                "crsn": "B",
-                "srdt": "20000203",
-                "ctln": "ctln_i",
-            },
-            "isorce": "isorce",
-            "icom": ["first comment", "second comment"],
-        },
-        de_subheader_part={
-            # Data is unclassified.  These fields are filled for testing purposes only.
-            "security": {
-                "clas": "U",
-                "clsy": "DD",
-                "code": "code_d",
-                "ctlh": "dd",
-                "rel": "rel_d",
-                "dctp": "X",
-                "dcdt": "",
-                "dcxm": "X3",
-                "dg": "",
-                "dgdt": "20000302",
-                "cltx": "CH_d",
-                "catp": "M",
-                "caut": "caut_d",
-                "crsn": "C",
-                "srdt": "20000303",
-                "ctln": "ctln_d",
-            },
-            "desshrp": "desshrp",
-            "desshli": "desshli",
-            "desshlin": "desshlin",
-            "desshabs": "desshabs",
-        },
-    )
+    schema = xml_schema(sksicd.VERSION_INFO[basis_version]["schema"])
+
+    metadata = _make_metadata(basis_etree)
     with out_sicd.open("wb") as f:
         with sksicd.NitfWriter(f, metadata) as writer:
             writer.write_image(basis_array)
@@ -146,7 +168,24 @@ def test_roundtrip(tmp_path, sicd_xml, pixel_type):
 
     schema.assertValid(reader.metadata.xmltree)
     assert metadata == reader.metadata
-    assert np.array_equal(basis_array, read_array)
+    # pixels must roundtrip bit-exact; reader returns big-endian so match byte order first
+    assert (
+        basis_array.tobytes()
+        == read_array.astype(basis_array.dtype, copy=False).tobytes()
+    )
+
+
+def test_nitfmetadata_eq():
+    basis_etree = lxml.etree.parse(DATAPATH / "example-sicd-1.4.0.xml")
+    metadata = _make_metadata(basis_etree)
+    assert metadata == _make_metadata(
+        lxml.etree.parse(DATAPATH / "example-sicd-1.4.0.xml")
+    )
+    assert metadata != _make_metadata(basis_etree, ostaid="other")
+    assert metadata != _make_metadata(
+        lxml.etree.parse(DATAPATH / "example-sicd-1.3.0.xml")
+    )
+    assert metadata != basis_etree
 
 
 def test_nitfheaderfields_from_header():
@@ -14,15 +14,24 @@ import sarkit.wgs84
 
 DATAPATH = pathlib.Path(__file__).parents[3] / "data"
 
+# the per-point HAE offsets continue the stream that drew the image coordinates
+_rng = np.random.default_rng(12345)
+_IM_COORDS = _rng.uniform(low=-24.0, high=24.0, size=(3, 4, 5, 2))
+_IM_COORDS.setflags(write=False)
+_HAE_OFFSETS = _rng.uniform(low=-24.0, high=24.0, size=_IM_COORDS.shape[:-1])
+_HAE_OFFSETS.setflags(write=False)
 
-@pytest.fixture
-def example_proj_metadata():
+SYNTAX_ONLY_SICD_XMLS = sorted((DATAPATH / "syntax_only/sicd").glob("*.xml"))
+
+
+@pytest.fixture(scope="session")
+def example_proj_metadata_session():
     etree = lxml.etree.parse(DATAPATH / "example-sicd-1.3.0.xml")
     return sicdproj.MetadataParams.from_xml(etree)
 
 
-@pytest.fixture
-def example_proj_metadata_bi():
+@pytest.fixture(scope="session")
+def example_proj_metadata_bi_session():
     etree = lxml.etree.parse(DATAPATH / "example-sicd-1.4.0.xml")
     proj_metadata = sicdproj.MetadataParams.from_xml(etree)
     assert not proj_metadata.is_monostatic()
@@ -30,25 +39,89 @@ def example_proj_metadata_bi():
 
 
 @pytest.fixture(
-    params=[DATAPATH / "example-sicd-1.3.0.xml", DATAPATH / "example-sicd-1.4.0.xml"]
+    scope="session",
+    params=[DATAPATH / "example-sicd-1.3.0.xml", DATAPATH / "example-sicd-1.4.0.xml"],
 )
-def mono_and_bi_proj_metadata(request):
+def mono_and_bi_proj_metadata_session(request):
     etree = lxml.etree.parse(request.param)
     return sicdproj.MetadataParams.from_xml(etree)
 
 
+# Tests are free to modify the metadata, so each gets its own copy of the parsed params
+@pytest.fixture
+def example_proj_metadata(example_proj_metadata_session):
+    return copy.deepcopy(example_proj_metadata_session)
+
+
+@pytest.fixture
+def example_proj_metadata_bi(example_proj_metadata_bi_session):
+    return copy.deepcopy(example_proj_metadata_bi_session)
+
+
+@pytest.fixture
+def mono_and_bi_proj_metadata(mono_and_bi_proj_metadata_session):
+    return copy.deepcopy(mono_and_bi_proj_metadata_session)
+
+
+_projection_sets_cache = {}
+
+
+def _cached_projection_sets(proj_metadata, im_coords):
+    """compute_projection_sets memoized on the identity of the (session) metadata and the coordinates
+
+    The cached arrays are shared by every caller, so they are made read-only.
+    """
+    key = (id(proj_metadata), im_coords.tobytes())
+    if key not in _projection_sets_cache:
+        proj_sets = sicdproj.compute_projection_sets(proj_metadata, im_coords)
+        for field in dataclasses.fields(proj_sets):
+            getattr(proj_sets, field.name).setflags(write=False)
+        _projection_sets_cache[key] = (proj_metadata, proj_sets)
+    cached_metadata, proj_sets = _projection_sets_cache[key]
+    assert cached_metadata is proj_metadata
+    return proj_sets
+
+
 @pytest.fixture(params=[(3, 4, 5, 2), (2,), (1, 2), (2, 2)])
 def image_grid_locations(request):
     return np.random.default_rng(12345).uniform(size=request.param)
 
 
+@functools.cache
+def _syntax_only_metadata_params(xml_file):
+    """Parsed XML and MetadataParams of a syntax-only SICD, shared by the per-file and aggregate tests"""
+    etree = lxml.etree.parse(xml_file)
+    return etree, sicdproj.MetadataParams.from_xml(etree)
+
+
+@pytest.mark.parametrize("xml_file", SYNTAX_ONLY_SICD_XMLS, ids=lambda x: x.name)
+def test_metadata_params_from_xml(xml_file):
+    etree, proj_metadata = _syntax_only_metadata_params(xml_file)
+    assert proj_metadata.Collect_Type == (
+        etree.findtext("{*}CollectionInfo/{*}CollectType") or "MONOSTATIC"
+    )
+    assert np.array_equal(
+        proj_metadata.SCP,
+        [
+            float(etree.findtext(f"{{*}}GeoData/{{*}}SCP/{{*}}ECF/{{*}}{c}"))
+            for c in "XYZ"
+        ],
+    )
+    assert proj_metadata.NumRows == int(etree.findtext("{*}ImageData/{*}NumRows"))
+    assert proj_metadata.NumCols == int(etree.findtext("{*}ImageData/{*}NumCols"))
+    assert proj_metadata.IFA == etree.findtext("{*}ImageFormation/{*}ImageFormAlgo")
+    assert (proj_metadata.tx_SCP_COA is None) == proj_metadata.is_monostatic()
+
+
 def test_metadata_params():
     all_attrs = set()
     set_attrs = set()
-    for xml_file in (DATAPATH / "syntax_only/sicd").glob("*.xml"):
-        etree = lxml.etree.parse(xml_file)
-        proj_metadata = sicdproj.MetadataParams.from_xml(etree)
-        pm_dict = dataclasses.asdict(proj_metadata)
+    for xml_file in SYNTAX_ONLY_SICD_XMLS:
+        _, proj_metadata = _syntax_only_metadata_params(xml_file)
+        pm_dict = {
+            f.name: getattr(proj_metadata, f.name)
+            for f in dataclasses.fields(proj_metadata)
+        }
         all_attrs.update(pm_dict.keys())
         set_attrs.update(k for k, v in pm_dict.items() if v is not None)
     unset_attrs = all_attrs - set_attrs
@@ -76,9 +149,7 @@ def test_metadata_params_is_monostatic(example_proj_metadata):
 
 
 def test_image_plane_parameters_roundtrip(example_proj_metadata):
-    image_grid_locations = np.random.default_rng(12345).uniform(
-        low=-24, high=24, size=(3, 4, 5, 2)
-    )
+    image_grid_locations = _IM_COORDS
     image_plane_points = sicdproj.image_grid_to_image_plane_point(
         example_proj_metadata.SCP,
         example_proj_metadata.uRow,
@@ -194,11 +265,9 @@ def test_compute_pt_r_rdot_parameters_mono(example_proj_metadata):
     assert pt_r_rdot_params.Rdot_Avg_PT == pytest.approx(rdot_scp)
 
 
-def test_r_rdot_to_ground_plane(example_proj_metadata):
-    im_coords = np.random.default_rng(12345).uniform(
-        low=-24.0, high=24.0, size=(3, 4, 5, 2)
-    )
-    proj_sets_mono = sicdproj.compute_projection_sets(example_proj_metadata, im_coords)
+def test_r_rdot_to_ground_plane(example_proj_metadata_session):
+    example_proj_metadata = example_proj_metadata_session
+    proj_sets_mono = _cached_projection_sets(example_proj_metadata, _IM_COORDS)
     scp_spn = sicdproj.compute_scp_coa_slant_plane_normal(example_proj_metadata)
     gpp_tgt_mono = sicdproj.r_rdot_to_ground_plane_mono(
         example_proj_metadata.LOOK,
@@ -230,27 +299,13 @@ def test_r_rdot_to_ground_plane(example_proj_metadata):
     assert success
 
 
-@pytest.mark.parametrize("scalar_hae", (True, False))
 @pytest.mark.parametrize(
-    "mdata_name", ("example_proj_metadata", "example_proj_metadata_bi")
+    "mdata_name", ("example_proj_metadata_session", "example_proj_metadata_bi_session")
 )
-def test_r_rdot_to_hae_surface(mdata_name, scalar_hae, request):
+def test_r_rdot_to_hae_surface(mdata_name, request):
     proj_metadata = request.getfixturevalue(mdata_name)
-    rng = np.random.default_rng(12345)
-    im_coords = rng.uniform(low=-24.0, high=24.0, size=(3, 4, 5, 2))
-    hae0 = proj_metadata.SCP_HAE
-    if not scalar_hae:
-        hae0 += rng.uniform(low=-24.0, high=24.0, size=im_coords.shape[:-1])
-    proj_sets = sicdproj.compute_projection_sets(proj_metadata, im_coords)
-    spp_tgt, _, success = sicdproj.r_rdot_to_constant_hae_surface(
-        proj_metadata.LOOK,
-        proj_metadata.SCP,
-        proj_sets,
-        hae0,
-    )
-    assert success
-    spp_llh = sarkit.wgs84.cartesian_to_geodetic(spp_tgt)
-    assert spp_llh[..., 2] == pytest.approx(hae0, abs=1e-6)
+    im_coords = _IM_COORDS
+    proj_sets = _cached_projection_sets(proj_metadata, im_coords)
 
     bad_index = (1, 2, 3)
     bad_proj_sets = copy.deepcopy(proj_sets)
@@ -259,15 +314,34 @@ def test_r_rdot_to_hae_surface(mdata_name, scalar_hae, request):
     else:
         bad_proj_sets.R_Avg_COA[bad_index] *= 1e6
 
-    spp_tgt_w_bad, _, success = sicdproj.r_rdot_to_constant_hae_surface(
-        proj_metadata.LOOK,
-        proj_metadata.SCP,
-        bad_proj_sets,
-        hae0,
+    # projection sets do not depend on the surface; share them for scalar and per-point HAE.
+    # The scalar is broadcast (zero-copy) to the grid shape so the solver sees the same layout
+    scalar_hae0 = np.broadcast_to(
+        np.float64(proj_metadata.SCP_HAE), im_coords.shape[:-1]
     )
-    assert not success
-    mismatched_index = np.argwhere((spp_tgt != spp_tgt_w_bad).any(axis=-1)).squeeze()
-    assert np.array_equal(bad_index, mismatched_index)
+    array_hae0 = proj_metadata.SCP_HAE + _HAE_OFFSETS
+    for hae0 in (scalar_hae0, array_hae0):
+        spp_tgt, _, success = sicdproj.r_rdot_to_constant_hae_surface(
+            proj_metadata.LOOK,
+            proj_metadata.SCP,
+            proj_sets,
+            hae0,
+        )
+        assert success
+        spp_llh = sarkit.wgs84.cartesian_to_geodetic(spp_tgt)
+        assert spp_llh[..., 2] == pytest.approx(hae0, abs=1e-6)
+
+        spp_tgt_w_bad, _, success = sicdproj.r_rdot_to_constant_hae_surface(
+            proj_metadata.LOOK,
+            proj_metadata.SCP,
+            bad_proj_sets,
+            hae0,
+        )
+        assert not success
+        mismatched_index = np.argwhere(
+            (spp_tgt != spp_tgt_w_bad).any(axis=-1)
+        ).squeeze()
+        assert np.array_equal(bad_index, mismatched_index)
 
 
 @pytest.mark.parametrize(
@@ -9,6 +9,11 @@ import sarkit.wgs84
 
 DATAPATH = pathlib.Path(__file__).parents[3] / "data"
 
+_IM_COORDS = np.random.default_rng(12345).uniform(
+    low=-24.0, high=24.0, size=(3, 4, 5, 2)
+)
+_IM_COORDS.setflags(write=False)
+
 
 @pytest.mark.parametrize("method", ("monostatic", "bistatic", None))
 def test_scp_image_to_ground_mono(method):
@@ -44,9 +49,7 @@ def _assert_image_to_ground_projections(sicd_xml, method):
     assert delta_gp.shape == in_shape[:-1]
 
     # Project ND-array around SCP - assumes validity close to SCP
-    im_coords = np.random.default_rng(12345).uniform(
-        low=-24.0, high=24.0, size=(3, 4, 5, 2)
-    )
+    im_coords = _IM_COORDS
     plane_coords, delta_gp, success = sksicd.image_to_ground_plane(
         sicd_xmltree,
         im_coords,
@@ -106,9 +109,7 @@ def test_image_to_constant_hae_surface(sicd_xml):
     assert delta_hae_max.shape == scp_coords.shape[:-1]
 
     # Project ND-array around SCP - assumes validity close to SCP
-    im_coords = np.random.default_rng(12345).uniform(
-        low=-24.0, high=24.0, size=(3, 4, 5, 2)
-    )
+    im_coords = _IM_COORDS
     surf_coords, delta_hae_max, success = sksicd.image_to_constant_hae_surface(
         sicd_xmltree,
         im_coords,
@@ -1,4 +1,4 @@
-import copy
+import functools
 import pathlib
 
 import lxml.etree
@@ -9,11 +9,13 @@ import sarkit.sicd as sksicd
 
 DATAPATH = pathlib.Path(__file__).parents[3] / "data"
 
+SYNTAX_ONLY_SICD_XMLS = sorted((DATAPATH / "syntax_only/sicd").glob("*.xml"))
 
-def test_image_corners_type():
+
+def test_image_corners_type(xml_schema):
     etree = lxml.etree.parse(DATAPATH / "example-sicd-1.3.0.xml")
     xml_helper = sksicd.XmlHelper(etree)
-    schema = lxml.etree.XMLSchema(file=sksicd.VERSION_INFO["urn:SICD:1.3.0"]["schema"])
+    schema = xml_schema(sksicd.VERSION_INFO["urn:SICD:1.3.0"]["schema"])
     schema.assertValid(etree)
 
     new_corner_coords = np.array(
@@ -37,56 +39,97 @@ def test_image_corners_type():
     )
 
 
-def test_transcoders():
+def _postorder(root):
+    """Yield the elements of ``root`` with every child before its parent"""
+    stack = [(root, False)]
+    while stack:
+        node, children_visited = stack.pop()
+        if children_visited:
+            yield node
+        else:
+            stack.append((node, True))
+            stack.extend((child, False) for child in reversed(node))
+
+
+@functools.cache
+def _roundtrip_transcoders(xml_file, xml_schema):
+    """Roundtrip every element of ``xml_file``
+
+    Returns the names of the transcoders that roundtripped and the paths of leaves without one.
+    Cached so the aggregate test reuses the per-file results.
+    """
     used_transcoders = set()
     no_transcode_leaf = set()
-    for xml_file in (DATAPATH / "syntax_only/sicd").glob("*.xml"):
-        etree = lxml.etree.parse(xml_file)
-        basis_version = lxml.etree.QName(etree.getroot()).namespace
-        schema = lxml.etree.XMLSchema(file=sksicd.VERSION_INFO[basis_version]["schema"])
-        schema.assertValid(etree)
-        xml_helper = sksicd.XmlHelper(etree)
-        for elem in reversed(list(xml_helper.element_tree.iter())):
-            try:
-                val = xml_helper.load_elem(elem)
-                xml_helper.set_elem(elem, val)
-                schema.assertValid(xml_helper.element_tree)
-                np.testing.assert_equal(xml_helper.load_elem(elem), val)
-                used_transcoders.add(xml_helper.get_transcoder_name(elem))
-            except LookupError:
-                if len(elem) == 0:
-                    no_transcode_leaf.add(xml_helper.element_tree.getelementpath(elem))
+    etree = lxml.etree.parse(xml_file)
+    basis_version = lxml.etree.QName(etree.getroot()).namespace
+    schema = xml_schema(sksicd.VERSION_INFO[basis_version]["schema"])
+    schema.assertValid(etree)
+    xml_helper = sksicd.XmlHelper(etree)
+    for elem in _postorder(xml_helper.element_tree.getroot()):
+        try:
+            val = xml_helper.load_elem(elem)
+            xml_helper.set_elem(elem, val)
+            np.testing.assert_equal(xml_helper.load_elem(elem), val)
+            used_transcoders.add(xml_helper.get_transcoder_name(elem))
+        except LookupError:
+            if len(elem) == 0:
+                no_transcode_leaf.add(xml_helper.element_tree.getelementpath(elem))
+    schema.assertValid(xml_helper.element_tree)
+    return frozenset(used_transcoders), frozenset(no_transcode_leaf)
+
+
+@pytest.mark.parametrize("xml_file", SYNTAX_ONLY_SICD_XMLS, ids=lambda x: x.name)
+def test_transcoders(xml_file, xml_schema):
+    _, no_transcode_leaf = _roundtrip_transcoders(xml_file, xml_schema)
+    assert not no_transcode_leaf
+
+
+def test_transcoders_all_used(xml_schema):
+    # aggregated in its own test so it still holds when per-file tests are distributed
+    used_transcoders = set()
+    for xml_file in SYNTAX_ONLY_SICD_XMLS:
+        used_transcoders |= _roundtrip_transcoders(xml_file, xml_schema)[0]
     unused_transcoders = sksicd.TRANSCODERS.keys() - used_transcoders
     assert not unused_transcoders
-    assert not no_transcode_leaf
 
 
-def _replace_scpcoa(sicd_xmltree):
+def _replace_scpcoa(sicd_xmltree, xml_schema):
     scpcoa = sksicd.compute_scp_coa(sicd_xmltree)
     sicd_xmltree.getroot().replace(sicd_xmltree.find(".//{*}SCPCOA"), scpcoa)
     basis_version = lxml.etree.QName(sicd_xmltree.getroot()).namespace
-    schema = lxml.etree.XMLSchema(file=sksicd.VERSION_INFO[basis_version]["schema"])
+    schema = xml_schema(sksicd.VERSION_INFO[basis_version]["schema"])
     schema.assertValid(sicd_xmltree)
     return scpcoa
 
 
-@pytest.mark.parametrize("xml_file", DATAPATH.glob("example-sicd*.xml"))
-def test_compute_scp_coa(xml_file):
-    _replace_scpcoa(lxml.etree.parse(xml_file))
+@pytest.fixture(
+    scope="session",
+    params=sorted(DATAPATH.glob("example-sicd*.xml")),
+    ids=lambda xml_file: xml_file.name,
+)
+def example_sicd_xml_bytes(request):
+    return lxml.etree.tostring(lxml.etree.parse(request.param))
 
 
-def test_compute_scp_coa_bistatic():
+def test_compute_scp_coa(example_sicd_xml_bytes, xml_schema):
+    etree = lxml.etree.ElementTree(lxml.etree.fromstring(example_sicd_xml_bytes))
+    _replace_scpcoa(etree, xml_schema)
+
+
+def test_compute_scp_coa_bistatic(xml_schema):
     etree = lxml.etree.parse(DATAPATH / "example-sicd-1.3.0.xml")
+    xml_bytes = lxml.etree.tostring(etree)
+
     # Monostatic
     assert etree.findtext("./{*}CollectionInfo/{*}CollectType") == "MONOSTATIC"
-    scpcoa_mono = _replace_scpcoa(copy.deepcopy(etree))
+    scpcoa_mono = _replace_scpcoa(etree, xml_schema)
     assert scpcoa_mono.find(".//{*}Bistatic") is None
 
     # Bistatic
-    etree_bistatic = copy.deepcopy(etree)
-    for elem in etree_bistatic.iter():
-        elem.tag = f"{{urn:SICD:1.4.0}}{lxml.etree.QName(elem).localname}"
+    etree_bistatic = lxml.etree.ElementTree(
+        lxml.etree.fromstring(xml_bytes.replace(b"urn:SICD:1.3.0", b"urn:SICD:1.4.0"))
+    )
     xmlhelp_bistatic = sksicd.XmlHelper(etree_bistatic)
     xmlhelp_bistatic.set("./{*}CollectionInfo/{*}CollectType", "BISTATIC")
-    scpcoa_bistatic_diff = _replace_scpcoa(etree_bistatic)
+    scpcoa_bistatic_diff = _replace_scpcoa(etree_bistatic, xml_schema)
     assert scpcoa_bistatic_diff.find(".//{*}Bistatic") is not None
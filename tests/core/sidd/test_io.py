@@ -1,6 +1,11 @@
+import contextlib
+import hashlib
+import io
 import itertools
+import os
 import pathlib
 import re
+import types
 
 import lxml.etree
 import numpy as np
@@ -21,8 +26,15 @@ def _random_image(sidd_xmltree):
 
     assert xml_helper.load("./{*}Display/{*}PixelType") == "MONO8I"
 
-    return np.random.default_rng().integers(
-        0, 255, size=shape, dtype=np.uint8, endpoint=True
+    return np.frombuffer(os.urandom(rows * cols), dtype=np.uint8).reshape(shape).copy()
+
+
+def _make_product_image_metadata(xmltree, **kwargs):
+    return sksidd.NitfProductImageMetadata(
+        xmltree=xmltree,
+        im_subheader_part={"tgtid": "tgtid", "iid2": "iid2", "security": {"clas": "U"}},
+        de_subheader_part={"security": {"clas": "U"}},
+        **kwargs,
     )
 
 
@@ -34,15 +46,24 @@ def _random_image(sidd_xmltree):
         DATAPATH / "example-sidd-3.0.0.xml",
     ],
 )
-def test_roundtrip(force_segmentation, sidd_xml, tmp_path, monkeypatch):
-    out_sidd = tmp_path / "out.sidd"
+@pytest.mark.parametrize("in_memory", [False, True])
+def test_roundtrip(force_segmentation, sidd_xml, in_memory, tmp_path, monkeypatch):
+    if in_memory:
+        buffer = io.BytesIO()
+
+        def _open(mode):
+            buffer.seek(0)
+            return contextlib.nullcontext(buffer)
+    else:
+        _open = (tmp_path / "out.sidd").open
     sicd_xmltree = lxml.etree.parse(DATAPATH / "example-sicd-1.4.0.xml")
     basis_etree0 = lxml.etree.parse(sidd_xml)
     basis_array0 = _random_image(basis_etree0)
 
     basis_etree1 = lxml.etree.parse(sidd_xml)
     basis_etree1.find("./{*}Display/{*}PixelType").text = "MONO16I"
-    basis_array1 = 2**16 - 1 - basis_array0.astype(np.uint16)
+    basis_array1 = basis_array0.astype(np.uint16)
+    np.invert(basis_array1, out=basis_array1)  # == 2**16 - 1 - basis_array0
 
     basis_etree2 = lxml.etree.parse(sidd_xml)
     basis_etree2.find("./{*}Display/{*}PixelType").text = "RGB24I"
@@ -165,84 +186,11 @@ def test_roundtrip(force_segmentation, sidd_xml, tmp_path, monkeypatch):
                     "desshabs": "desshabs",
                 },
             ),
-            sksidd.NitfProductImageMetadata(
-                xmltree=basis_etree1,
-                im_subheader_part={
-                    "tgtid": "tgtid",
-                    "iid2": "iid2",
-                    "security": {
-                        "clas": "U",
-                    },
-                },
-                de_subheader_part={
-                    "security": {
-                        "clas": "U",
-                    },
-                },
-            ),
-            sksidd.NitfProductImageMetadata(
-                xmltree=basis_etree2,
-                im_subheader_part={
-                    "tgtid": "tgtid",
-                    "iid2": "iid2",
-                    "security": {
-                        "clas": "U",
-                    },
-                },
-                de_subheader_part={
-                    "security": {
-                        "clas": "U",
-                    },
-                },
-            ),
-            sksidd.NitfProductImageMetadata(
-                xmltree=basis_etree3,
-                im_subheader_part={
-                    "tgtid": "tgtid",
-                    "iid2": "iid2",
-                    "security": {
-                        "clas": "U",
-                    },
-                },
-                de_subheader_part={
-                    "security": {
-                        "clas": "U",
-                    },
-                },
-                lookup_table=lookup_table3,
-            ),
-            sksidd.NitfProductImageMetadata(
-                xmltree=basis_etree4,
-                im_subheader_part={
-                    "tgtid": "tgtid",
-                    "iid2": "iid2",
-                    "security": {
-                        "clas": "U",
-                    },
-                },
-                de_subheader_part={
-                    "security": {
-                        "clas": "U",
-                    },
-                },
-                lookup_table=lookup_table4,
-            ),
-            sksidd.NitfProductImageMetadata(
-                xmltree=basis_etree5,
-                im_subheader_part={
-                    "tgtid": "tgtid",
-                    "iid2": "iid2",
-                    "security": {
-                        "clas": "U",
-                    },
-                },
-                de_subheader_part={
-                    "security": {
-                        "clas": "U",
-                    },
-                },
-                lookup_table=lookup_table5,
-            ),
+            _make_product_image_metadata(basis_etree1),
+            _make_product_image_metadata(basis_etree2),
+            _make_product_image_metadata(basis_etree3, lookup_table=lookup_table3),
+            _make_product_image_metadata(basis_etree4, lookup_table=lookup_table4),
+            _make_product_image_metadata(basis_etree5, lookup_table=lookup_table5),
         ]
     )
 
@@ -274,7 +222,7 @@ def test_roundtrip(force_segmentation, sidd_xml, tmp_path, monkeypatch):
         ]
     )
 
-    with out_sidd.open("wb") as file:
+    with _open("wb") as file:
         with sksidd.NitfWriter(file, write_metadata) as writer:
             writer.write_image(0, basis_array0)
             writer.write_image(1, basis_array1)
@@ -297,12 +245,12 @@ def test_roundtrip(force_segmentation, sidd_xml, tmp_path, monkeypatch):
     )
     if force_segmentation:
         assert num_expected_imseg > 2  # make sure the monkeypatch caused segmentation
-    with out_sidd.open("rb") as file:
+    with _open("rb") as file:
         ntf = sarkit._nitf_io.Nitf()
         ntf.load(file)
         assert num_expected_imseg == len(ntf["ImageSegments"])
 
-    with out_sidd.open("rb") as file:
+    with _open("rb") as file:
         with sksidd.NitfReader(file) as reader:
             read_metadata = reader.metadata
             assert len(read_metadata.images) == 6
@@ -319,13 +267,16 @@ def test_roundtrip(force_segmentation, sidd_xml, tmp_path, monkeypatch):
             read_ps_xmltree0 = read_metadata.product_support_xmls[0].xmltree
             read_ps_xmltree1 = read_metadata.product_support_xmls[1].xmltree
 
-    def _normalized(xmltree):
-        return lxml.etree.tostring(xmltree, method="c14n")
+    def _c14n_digest(xmltree):
+        # stream the canonical XML through the hash rather than materializing it
+        digest = hashlib.blake2b(digest_size=16)
+        xmltree.write_c14n(types.SimpleNamespace(write=digest.update))
+        return digest.digest()
 
-    assert _normalized(read_xmltree) == _normalized(basis_etree0)
-    assert _normalized(read_ps_xmltree0) == _normalized(ps_xmltree0)
-    assert _normalized(read_ps_xmltree1) == _normalized(ps_xmltree1)
-    assert _normalized(read_sicd_xmltree) == _normalized(sicd_xmltree)
+    assert _c14n_digest(read_xmltree) == _c14n_digest(basis_etree0)
+    assert _c14n_digest(read_ps_xmltree0) == _c14n_digest(ps_xmltree0)
+    assert _c14n_digest(read_ps_xmltree1) == _c14n_digest(ps_xmltree1)
+    assert _c14n_digest(read_sicd_xmltree) == _c14n_digest(sicd_xmltree)
 
     assert write_metadata.file_header_part == read_metadata.file_header_part
     assert (
@@ -354,6 +305,32 @@ def test_roundtrip(force_segmentation, sidd_xml, tmp_path, monkeypatch):
     )
 
 
+class _TrickleIO(io.BytesIO):
+    """In-memory file that transfers at most a few bytes per call, like a raw stream may"""
+
+    def readinto(self, buffer):
+        return super().readinto(memoryview(buffer)[:7])
+
+    def write(self, buffer):
+        return super().write(memoryview(buffer)[:7])
+
+
+def test_partial_transfers():
+    array = np.arange(100, dtype=">u2").reshape(10, 10)
+    file_object = _TrickleIO()
+    sarkit.sidd._io._write_all(file_object, array[:, ::2])
+    assert file_object.getvalue() == array[:, ::2].tobytes()
+
+    file_object.seek(0)
+    read_back = np.empty((10, 5), array.dtype)
+    sarkit.sidd._io._readinto_exactly(file_object, read_back)
+    assert np.array_equal(read_back, array[:, ::2])
+
+    file_object.seek(-1, os.SEEK_END)
+    with pytest.raises(EOFError):
+        sarkit.sidd._io._readinto_exactly(file_object, read_back)
+
+
 def test_segmentation():
     """From Figure 2.5-6 SIDD 1.0 Multiple Input Image - Multiple Product Images Requiring Segmentation"""
     sidd_xmltree = lxml.etree.parse(DATAPATH / "example-sidd-3.0.0.xml")
@@ -74,25 +74,25 @@ def test_sfapointtype():
     assert np.array_equal(sksidd.SfaPointType().parse_elem(elem), data[:-1])
 
 
-def test_transcoders():
+def test_transcoders(xml_schema):
     used_transcoders = set()
     no_transcode_leaf = set()
     for xml_file in (DATAPATH / "syntax_only/sidd").glob("*.xml"):
         etree = lxml.etree.parse(xml_file)
         basis_version = lxml.etree.QName(etree.getroot()).namespace
-        schema = lxml.etree.XMLSchema(file=sksidd.VERSION_INFO[basis_version]["schema"])
+        schema = xml_schema(sksidd.VERSION_INFO[basis_version]["schema"])
         schema.assertValid(etree)
         xml_helper = sksidd.XmlHelper(etree)
         for elem in reversed(list(xml_helper.element_tree.iter())):
             try:
                 val = xml_helper.load_elem(elem)
                 xml_helper.set_elem(elem, val)
-                schema.assertValid(xml_helper.element_tree)
                 np.testing.assert_equal(xml_helper.load_elem(elem), val)
                 used_transcoders.add(xml_helper.get_transcoder_name(elem))
             except LookupError:
                 if len(elem) == 0:
                     no_transcode_leaf.add(xml_helper.element_tree.getelementpath(elem))
+        schema.assertValid(xml_helper.element_tree)
     unused_transcoders = sksidd.TRANSCODERS.keys() - used_transcoders
     assert not unused_transcoders
 
@@ -1,6 +1,7 @@
 import itertools
 import sys
 
+import numpy as np
 import pytest
 
 import sarkit.verification._consistency as con
@@ -87,17 +88,15 @@ def test_all(dummycon, capsys, monkeypatch):
 
     failures = dummycon.failures()
     details = itertools.chain.from_iterable(
-        [value["details"] for value in failures.values()]
+        value["details"] for value in failures.values()
     )
-    passed = [item for item in details if item["passed"]]
-    assert passed
+    assert any(item["passed"] for item in details)
 
     failures = dummycon.failures(omit_passed_sub=True)
     details = itertools.chain.from_iterable(
-        [value["details"] for value in failures.values()]
+        value["details"] for value in failures.values()
     )
-    passed = [item for item in details if item["passed"]]
-    assert not passed
+    assert not any(item["passed"] for item in details)
 
     def prints_color():
         captured = capsys.readouterr()
@@ -160,6 +159,35 @@ def test_check_with_ignore_specific(dummycon, should_ignore):
     assert was_tested != should_ignore
 
 
+def test_check_with_ignore_multiple(dummycon):
+    dummycon.check(
+        ignore_patterns=["check_need", "check_.*_want_pass", "check_exception$"]
+    )
+    assert set(dummycon.all()) == {
+        "check_pre_need_pass",
+        "check_nopre_need_pass",
+        "check_want_pass",
+        "check_want_fail",
+    }
+
+
+def test_check_with_ignore_independent_patterns(dummycon):
+    # patterns are compiled separately so flags and group names cannot collide
+    dummycon.check(
+        ignore_patterns=[
+            "(?i)CHECK_NEED",
+            "(?P<kind>check_want)_pass",
+            "(?P<kind>check_pre)_want",
+            "check_.*_need_pass",
+        ]
+    )
+    assert set(dummycon.all()) == {
+        "check_want_fail",
+        "check_nopre_want_pass",
+        "check_exception",
+    }
+
+
 def test_invalid(dummycon):
     with pytest.raises(ValueError):
         dummycon.check("this_does_not_exist")
@@ -177,3 +205,12 @@ def test_approx():
     assert apx < 10.01
     assert apx <= 10.01
     assert repr(apx) == "10.0 ± 0.1"
+    # integers are compared as floats, as in np.isclose, so differences cannot wrap around
+    assert con.Approx(np.uint8(5), atol=3) == np.uint8(3)
+    assert con.Approx(np.uint8(3), atol=1) != np.uint8(5)
+    assert con.Approx(np.int8(-100), atol=1) != np.int8(100)
+    assert con.Approx(np.int64(2**62), atol=10) != np.int64(-(2**62))
+    assert con.Approx(np.int64(-(2**62)), atol=10) != np.int64(2**62)
+    for attr in ("value", "atol", "rtol"):
+        with pytest.raises(AttributeError):
+            setattr(apx, attr, 1.0)